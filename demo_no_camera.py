@@ -4,21 +4,34 @@ Smart Energy Saver Demo - No Camera Required
 Simulates motion detection for testing and demonstration purposes
 """
 
+import sys
 import time
-import random
 import threading
 from datetime import datetime
-import json
+import orjson
+import numpy as np
 
 class MockMotionDetector:
     """Simulates motion detection for demo purposes"""
     
+    POOL_SIZE = 10000  # Samples drawn per batch
+    
     def __init__(self):
         self.motion_probability = 0.3  # 30% chance of motion per check
+        self.refill_pool()
+    
+    def refill_pool(self):
+        """Pre-generate a batch of motion/no-motion samples"""
+        self._pool = np.random.random(self.POOL_SIZE) < self.motion_probability
+        self._idx = 0
     
     def detect_motion(self):
         """Simulate motion detection"""
-        return random.random() < self.motion_probability
+        motion = self._pool[self._idx]
+        self._idx += 1
+        if self._idx == self.POOL_SIZE:
+            self.refill_pool()
+        return bool(motion)
 
 class EnergyController:
     """Handles the control of electrical appliances"""
@@ -52,10 +65,20 @@ class DemoEnergySaver:
         self.no_motion_timeout = no_motion_timeout
         self.last_motion_time = time.time()
         self.running = False
+        self.check_interval = 2.0
+        self._stop = threading.Event()
         
         self.motion_detector = MockMotionDetector()
         self.energy_controller = EnergyController()
         self.events = []
+        self.output = []  # Status lines written once per loop iteration
+    
+    def flush_output(self):
+        """Write buffered status lines to stdout in a single call"""
+        if self.output:
+            sys.stdout.write('\n'.join(self.output) + '\n')
+            sys.stdout.flush()
+            self.output.clear()
     
     def log_event(self, motion_detected, action=None):
         """Log events for demo"""
@@ -68,23 +91,24 @@ class DemoEnergySaver:
         self.events.append(event)
         
         if motion_detected:
-            print(f"📹 [{event['timestamp']}] Motion detected!")
+            self.output.append(f"📹 [{event['timestamp']}] Motion detected!")
         else:
-            print(f"⏰ [{event['timestamp']}] No motion - timeout reached")
+            self.output.append(f"⏰ [{event['timestamp']}] No motion - timeout reached")
     
     def run_demo(self, duration=60):
         """Run the demo for specified duration"""
         print("🎬 Starting Smart Energy Saver Demo")
         print(f"⏱️  Demo duration: {duration} seconds")
-        print(f"🔄 Motion check interval: 2 seconds")
+        print(f"🔄 Motion check interval: {self.check_interval:g} seconds")
         print(f"⏰ No motion timeout: {self.no_motion_timeout} seconds")
         print("-" * 50)
         
         start_time = time.time()
         self.running = True
+        self._stop.clear()
         
         try:
-            while self.running and (time.time() - start_time) < duration:
+            while self.running and not self._stop.is_set() and (time.time() - start_time) < duration:
                 # Simulate motion detection check
                 motion_detected = self.motion_detector.detect_motion()
                 current_time = time.time()
@@ -105,11 +129,19 @@ class DemoEnergySaver:
                 status = f"Lights: {'ON' if self.energy_controller.lights_on else 'OFF'} | "
                 status += f"Fans: {'ON' if self.energy_controller.fans_on else 'OFF'} | "
                 status += f"Time since motion: {time_since_motion:.1f}s"
-                print(f"📊 Status: {status}")
+                self.output.append(f"📊 Status: {status}")
+                self.flush_output()
                 
-                time.sleep(2)  # Check every 2 seconds for demo
+                # Wake up early if the shutdown deadline falls inside the interval
+                time_to_timeout = self.no_motion_timeout - (time.time() - self.last_motion_time)
+                wait = self.check_interval
+                if time_to_timeout > 0:
+                    wait = min(wait, time_to_timeout)
+                wait = min(wait, duration - (time.time() - start_time))
+                self._stop.wait(timeout=max(0, wait))
                 
         except KeyboardInterrupt:
+            self._stop.set()
             print("\n🛑 Demo stopped by user")
         
         self.running = False
@@ -135,15 +167,15 @@ class DemoEnergySaver:
                 print(f"  {event['timestamp']} - {status} - {event['action']}")
         
         # Save demo results
-        with open('demo_results.json', 'w') as f:
-            json.dump({
+        with open('demo_results.json', 'wb') as f:
+            f.write(orjson.dumps({
                 'demo_summary': {
                     'motion_detections': len(motion_events),
                     'energy_saves': len(energy_saves),
                     'total_events': len(self.events)
                 },
                 'events': self.events
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Demo results saved to 'demo_results.json'")
 
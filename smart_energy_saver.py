@@ -8,11 +8,15 @@ import cv2
 import numpy as np
 import time
 import logging
+import logging.handlers
 from datetime import datetime
-import json
+import orjson
+import queue
 import threading
 from typing import Optional, Tuple, Dict, Any
 import argparse
+import os
+import sys
 
 # For GPIO control (uncomment when using Raspberry Pi)
 # import RPi.GPIO as GPIO
@@ -100,66 +104,210 @@ class EnergyController:
             pass
 
 
+def cuda_available() -> bool:
+    """Check whether OpenCV was built with CUDA and a device is present"""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
 class MotionDetector:
     """Handles motion detection using OpenCV"""
     
-    def __init__(self, sensitivity: int = 25, min_area: int = 1000):
+    def __init__(self, sensitivity: int = 25, min_area: int = 1000,
+                 frame_size: Tuple[int, int] = (640, 480), scale: float = 1.0):
         self.sensitivity = sensitivity
+        # min_area is given in full-resolution pixels; frames passed to
+        # detect_motion are expected to be downscaled by `scale`
         self.min_area = min_area
+        self.scale = scale
         self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
             detectShadows=True, varThreshold=50
         )
         self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        
+        # Scratch buffers reused across frames to avoid per-frame allocations
+        width, height = int(frame_size[0] * scale), int(frame_size[1] * scale)
+        self._fg = np.empty((height, width), np.uint8)
+        self._tmp = np.empty_like(self._fg)
+        self._gray = np.empty_like(self._fg)
+        
+        # Run the per-pixel pipeline on the GPU when a CUDA device is present
+        self.gpu = cuda_available()
+        if self.gpu:
+            self.setup_gpu()
     
-    def detect_motion(self, frame: np.ndarray) -> Tuple[bool, np.ndarray, list]:
-        """
-        Detect motion in the given frame
-        Returns: (motion_detected, processed_frame, contours)
-        """
+    def setup_gpu(self):
+        """Create CUDA background subtractor, filters and device buffers"""
+        self.gpu_subtractor = cv2.cuda.createBackgroundSubtractorMOG2(
+            detectShadows=True, varThreshold=50
+        )
+        self.gpu_open = cv2.cuda.createMorphologyFilter(
+            cv2.MORPH_OPEN, cv2.CV_8UC1, self.kernel
+        )
+        self.gpu_close = cv2.cuda.createMorphologyFilter(
+            cv2.MORPH_CLOSE, cv2.CV_8UC1, self.kernel
+        )
+        self.stream = cv2.cuda.Stream()
+        self.gpu_frame = cv2.cuda_GpuMat()
+        self.gpu_mask = cv2.cuda_GpuMat()
+        self.gpu_tmp = cv2.cuda_GpuMat()
+    
+    def foreground_mask_cpu(self, frame: np.ndarray) -> np.ndarray:
+        """Compute the cleaned foreground mask on the CPU"""
         # Apply background subtraction
-        fg_mask = self.background_subtractor.apply(frame)
+        fg_mask = self.background_subtractor.apply(frame, self._fg)
         
-        # Remove shadows
-        fg_mask[fg_mask == 127] = 0
+        # Remove shadows (127) in place, keeping only definite foreground (255)
+        cv2.threshold(fg_mask, 128, 255, cv2.THRESH_BINARY, dst=fg_mask)
         
         # Morphological operations to reduce noise
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.kernel)
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, self.kernel)
+        cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.kernel, dst=self._tmp)
+        cv2.morphologyEx(self._tmp, cv2.MORPH_CLOSE, self.kernel, dst=fg_mask)
+        return fg_mask
+    
+    def foreground_mask_gpu(self, frame: np.ndarray) -> np.ndarray:
+        """Compute the cleaned foreground mask on the GPU"""
+        self.gpu_frame.upload(frame, self.stream)
+        self.gpu_subtractor.apply(self.gpu_frame, -1, self.stream, self.gpu_mask)
+        cv2.cuda.threshold(self.gpu_mask, 128, 255, cv2.THRESH_BINARY,
+                           self.gpu_tmp, self.stream)
+        self.gpu_open.apply(self.gpu_tmp, self.gpu_mask, self.stream)
+        self.gpu_close.apply(self.gpu_mask, self.gpu_tmp, self.stream)
+        
+        # Only the single-channel mask comes back for blob measurement
+        self.gpu_tmp.download(self.stream, self._fg)
+        self.stream.waitForCompletion()
+        return self._fg
+    
+    def prepare_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Size the scratch buffers for the frame and convert it to grayscale"""
+        if self._fg.shape != frame.shape[:2]:
+            self._fg = np.empty(frame.shape[:2], np.uint8)
+            self._tmp = np.empty_like(self._fg)
+            self._gray = np.empty_like(self._fg)
+        
+        # Occupancy doesn't need color; MOG2 on one channel is ~3x less work
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return frame
+    
+    def detect_motion(self, frame: np.ndarray) -> Tuple[bool, np.ndarray, list]:
+        """
+        Detect motion in the given frame
+        Returns: (motion_detected, processed_frame, contours)
         
-        # Find contours
-        contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        The returned mask is an internal buffer overwritten on the next call;
+        copy it if it needs to be retained.
+        """
+        frame = self.prepare_frame(frame)
         
-        motion_detected = False
+        if self.gpu:
+            fg_mask = self.foreground_mask_gpu(frame)
+        else:
+            fg_mask = self.foreground_mask_cpu(frame)
+        
+        # No blob can exceed min_area if the whole mask doesn't, so most quiet
+        # frames can skip labelling entirely
+        min_area = self.min_area * self.scale ** 2
+        if cv2.countNonZero(fg_mask) <= min_area:
+            return False, fg_mask, []
+        
+        # Measure all blobs in one pass (label 0 is the background)
+        _, labels, stats, _ = cv2.connectedComponentsWithStats(fg_mask, connectivity=8)
+        significant = stats[1:, cv2.CC_STAT_AREA] > min_area
+        motion_detected = bool(significant.any())
+
+        # Contours are only needed for drawing, so trace them only when there is motion
         significant_contours = []
-        
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > self.min_area:
-                motion_detected = True
-                significant_contours.append(contour)
-        
-        return motion_detected, fg_mask, significant_contours
+        if motion_detected:
+            blob_mask = np.isin(labels, np.flatnonzero(significant) + 1).astype(np.uint8)
+            significant_contours, _ = cv2.findContours(
+                blob_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            )
+
+        return motion_detected, fg_mask, list(significant_contours)
 
 
 class EventLogger:
     """Handles logging of motion events and system actions"""
     
-    def __init__(self, log_file: str = "energy_saver.log"):
+    def __init__(self, log_file: str = "energy_saver.log",
+                 events_file: str = "motion_events.jsonl"):
         self.log_file = log_file
+        self.events_file = events_file
+        
+        # The journal is append-only across runs; remember where this
+        # session's events start so exports only cover this session
+        try:
+            self._journal_start = os.path.getsize(events_file)
+        except OSError:
+            self._journal_start = 0
+        
+        # Running counters for today's events, so stats never rescan the history
+        self._today = datetime.now().date()
+        self._today_total = 0
+        self._motion_count = 0
+        self._save_count = 0
+        
+        # Events are only kept on disk, journaled by a background writer thread
+        # so the main loop never blocks on file I/O; events are dropped (and
+        # counted) if the writer falls too far behind
+        self.events_q = queue.Queue(maxsize=20000)
+        self.dropped = 0
+        self.writer_thread = None
+        
         self.setup_logging()
-        self.events = []
     
     def setup_logging(self):
         """Setup logging configuration"""
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        
+        # File records are buffered and written in batches; warnings and
+        # errors flush the buffer immediately
+        file_target = logging.FileHandler(self.log_file)
+        file_target.setFormatter(logging.Formatter(log_format))
+        self.file_handler = logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.WARNING,
+            target=file_target
+        )
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(self.log_file),
+                self.file_handler,
                 logging.StreamHandler()
             ]
         )
         self.logger = logging.getLogger(__name__)
+        
+        self.writer_thread = threading.Thread(target=self.event_writer, daemon=True)
+        self.writer_thread.start()
+    
+    def event_writer(self):
+        """Worker thread that appends queued events to the events file in batches"""
+        with open(self.events_file, 'ab', buffering=65536) as f:
+            while True:
+                batch = [self.events_q.get()]
+                while len(batch) < 256:
+                    try:
+                        batch.append(self.events_q.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                # None is the shutdown sentinel queued by close()
+                stop = None in batch
+                events = [e for e in batch if e is not None]
+                if events:
+                    f.write(b''.join(orjson.dumps(e, option=orjson.OPT_APPEND_NEWLINE)
+                                     for e in events))
+                    f.flush()
+                for _ in batch:
+                    self.events_q.task_done()
+                if stop:
+                    break
     
     def log_motion_event(self, detected: bool, appliance_action: str = None):
         """Log motion detection events"""
@@ -170,7 +318,18 @@ class EventLogger:
             'appliance_action': appliance_action
         }
         
-        self.events.append(event)
+        day = timestamp.date()
+        if day != self._today:
+            self._today = day
+            self._today_total = self._motion_count = self._save_count = 0
+        self._today_total += 1
+        self._motion_count += bool(detected)
+        self._save_count += (appliance_action == 'OFF')
+        
+        try:
+            self.events_q.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
         
         if detected:
             self.logger.info(f"Motion detected at {timestamp}")
@@ -180,57 +339,167 @@ class EventLogger:
         if appliance_action:
             self.logger.info(f"Appliance action: {appliance_action}")
     
+    def flush_events(self):
+        """Wait until all queued events have been written to the journal"""
+        if self.writer_thread and self.writer_thread.is_alive():
+            self.events_q.join()
+    
     def save_events_to_file(self, filename: str = "motion_events.json"):
-        """Save events to JSON file for analytics"""
-        with open(filename, 'w') as f:
-            json.dump(self.events, f, indent=2)
+        """Export this session's events from the journal to a JSON file for analytics"""
+        self.flush_events()
+        try:
+            with open(self.events_file, 'rb') as f:
+                f.seek(self._journal_start)
+                lines = [line for line in f.read().splitlines() if line]
+        except FileNotFoundError:
+            lines = []
+        
+        # Journal lines are already JSON objects, so no re-encoding is needed
+        with open(filename, 'wb') as f:
+            f.write(b'[' + b','.join(lines) + b']')
+    
+    def close(self):
+        """Flush pending events to disk and stop the writer thread"""
+        if self.writer_thread and self.writer_thread.is_alive():
+            self.events_q.put(None)
+            self.writer_thread.join(timeout=2)
+        
+        if self.dropped:
+            self.logger.warning(f"Dropped {self.dropped} events (writer queue full)")
+        
+        self.file_handler.flush()
     
     def get_daily_stats(self) -> Dict[str, Any]:
         """Get daily statistics"""
         today = datetime.now().date()
-        today_events = [e for e in self.events 
-                       if datetime.fromisoformat(e['timestamp']).date() == today]
-        
-        motion_count = sum(1 for e in today_events if e['motion_detected'])
-        energy_saves = sum(1 for e in today_events if e['appliance_action'] == 'OFF')
+        if today != self._today:
+            # No events logged yet today
+            return {
+                'date': today.isoformat(),
+                'total_events': 0,
+                'motion_detections': 0,
+                'energy_saves': 0
+            }
         
         return {
             'date': today.isoformat(),
-            'total_events': len(today_events),
-            'motion_detections': motion_count,
-            'energy_saves': energy_saves
+            'total_events': self._today_total,
+            'motion_detections': self._motion_count,
+            'energy_saves': self._save_count
         }
 
 
+class CaptureThread:
+    """Reads camera frames in a background thread, keeping only the latest one"""
+    
+    def __init__(self, cap: cv2.VideoCapture):
+        self.cap = cap
+        self.ok = True
+        self.latest = None
+        self.lock = threading.Lock()
+        self.new_frame = threading.Event()
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        """Start the capture thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self.capture_worker, daemon=True)
+        self.thread.start()
+    
+    def capture_worker(self):
+        """Worker thread that continuously grabs frames, dropping stale ones"""
+        try:
+            while self.running:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                
+                with self.lock:
+                    self.latest = frame
+                    self.new_frame.set()
+        finally:
+            # However the worker exits (read failure, exception or stop),
+            # report it so the main loop doesn't wait for frames forever
+            self.ok = False
+            self.new_frame.set()
+    
+    def read(self, timeout: float = 1.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Wait for the next frame
+        Returns: (ok, frame), where frame is None if none arrived within timeout
+        """
+        if not self.new_frame.wait(timeout):
+            return self.ok, None
+        
+        with self.lock:
+            frame = self.latest
+            self.latest = None
+            self.new_frame.clear()
+        return self.ok and frame is not None, frame
+    
+    def stop(self) -> bool:
+        """
+        Stop the capture thread
+        Returns: False if the thread is still running (e.g. blocked in a stalled read)
+        """
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2)
+        return not (self.thread and self.thread.is_alive())
+
+
 class SmartEnergySaver:
     """Main class that orchestrates the energy saving system"""
     
-    def __init__(self, camera_index: int = 0, no_motion_timeout: int = 60):
+    def __init__(self, camera_index: int = 0, no_motion_timeout: int = 60,
+                 frame_skip: int = 3, log_file: str = "energy_saver.log",
+                 events_file: str = "motion_events.jsonl"):
         self.camera_index = camera_index
         self.no_motion_timeout = no_motion_timeout
         self.last_motion_time = time.time()
         self.running = False
         
+        # Only every Nth frame is processed; the timeout is measured in
+        # seconds, so a lower detection rate has no visible effect
+        self._frame_skip = max(1, frame_skip)
+        
+        # Motion is detected on a downscaled copy of each frame
+        self.detection_scale = 0.5
+        
         # Initialize components
-        self.motion_detector = MotionDetector()
+        self.motion_detector = MotionDetector(scale=self.detection_scale)
         self.energy_controller = EnergyController()
-        self.logger = EventLogger()
+        self.logger = EventLogger(log_file, events_file)
         
         # Video capture
         self.cap = None
+        self.capture_thread = None
+        
+        # Overlay clock text, reformatted only when the second changes
+        self._ts_sec = 0
+        self._ts_str = ''
         
-        # Threading for non-blocking operation
-        self.timer_thread = None
-        self.timer_running = False
+        # Static overlay labels, rasterized once and pasted onto each frame
+        self.render_static_labels()
     
     def initialize_camera(self) -> bool:
         """Initialize the camera"""
-        self.cap = cv2.VideoCapture(self.camera_index)
+        # Use V4L2 directly on Linux, falling back to OpenCV's default backend
+        self.cap = None
+        if sys.platform.startswith('linux'):
+            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+        if self.cap is None or not self.cap.isOpened():
+            self.cap = cv2.VideoCapture(self.camera_index)
         if not self.cap.isOpened():
             print(f"Error: Could not open camera {self.camera_index}")
             return False
         
-        # Set camera properties for better performance
+        # Set camera properties for better performance; a one-frame driver
+        # buffer keeps the capture thread from reading stale frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # MJPG needs far less USB bandwidth than raw YUYV at the same frame rate
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cap.set(cv2.CAP_PROP_FPS, 30)
@@ -238,23 +507,35 @@ class SmartEnergySaver:
         print(f"Camera {self.camera_index} initialized successfully")
         return True
     
-    def timer_worker(self):
-        """Worker thread that monitors the no-motion timeout"""
-        while self.timer_running:
-            current_time = time.time()
-            time_since_motion = current_time - self.last_motion_time
-            
-            if time_since_motion >= self.no_motion_timeout:
-                if self.energy_controller.lights_on or self.energy_controller.fans_on:
-                    if self.energy_controller.turn_off_appliances():
-                        self.logger.log_motion_event(False, "OFF")
-            
-            time.sleep(1)  # Check every second
+    def render_static_labels(self):
+        """Pre-render the fixed overlay label text and record where values go"""
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        labels = [
+            # (text, origin, scale, color, thickness)
+            ("Time to shutdown: ", (10, 70), 0.7, (255, 255, 255), 2),
+            ("Lights: ", (10, 110), 0.6, (255, 255, 0), 2),
+            ("Fans: ", (10, 140), 0.6, (255, 255, 0), 2),
+        ]
+        
+        self._label_overlay = np.zeros((160, 320, 3), np.uint8)
+        self._value_x = []
+        for text, origin, scale, color, thickness in labels:
+            cv2.putText(self._label_overlay, text, origin, font, scale, color, thickness)
+            (width, _), _ = cv2.getTextSize(text, font, scale, thickness)
+            self._value_x.append(origin[0] + width)
+        self._label_mask = self._label_overlay.any(axis=2, keepdims=True)
     
     def draw_info_overlay(self, frame: np.ndarray, motion_detected: bool, 
                          time_since_motion: float) -> np.ndarray:
-        """Draw information overlay on the frame"""
-        overlay = frame.copy()
+        """Draw information overlay on the frame (in place)"""
+        overlay = frame
+        
+        # Static labels
+        h = min(overlay.shape[0], self._label_overlay.shape[0])
+        w = min(overlay.shape[1], self._label_overlay.shape[1])
+        np.copyto(overlay[:h, :w], self._label_overlay[:h, :w],
+                  where=self._label_mask[:h, :w])
+        timer_x, lights_x, fans_x = self._value_x
         
         # Status information
         status_text = "MOTION DETECTED" if motion_detected else "NO MOTION"
@@ -265,81 +546,149 @@ class SmartEnergySaver:
         
         # Timer information
         remaining_time = max(0, self.no_motion_timeout - time_since_motion)
-        timer_text = f"Time to shutdown: {remaining_time:.1f}s"
-        cv2.putText(overlay, timer_text, (10, 70), 
+        timer_text = f"{remaining_time:.1f}s"
+        cv2.putText(overlay, timer_text, (timer_x, 70), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Appliance status
         lights_status = "ON" if self.energy_controller.lights_on else "OFF"
         fans_status = "ON" if self.energy_controller.fans_on else "OFF"
         
-        cv2.putText(overlay, f"Lights: {lights_status}", (10, 110), 
+        cv2.putText(overlay, lights_status, (lights_x, 110), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-        cv2.putText(overlay, f"Fans: {fans_status}", (10, 140), 
+        cv2.putText(overlay, fans_status, (fans_x, 140), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
         
         # Current time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        cv2.putText(overlay, current_time, (10, frame.shape[0] - 20), 
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        cv2.putText(overlay, self._ts_str, (10, frame.shape[0] - 20), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
         
         return overlay
     
-    def run(self):
-        """Main execution loop"""
-        if not self.initialize_camera():
-            return
-        
-        self.running = True
-        self.timer_running = True
-        self.timer_thread = threading.Thread(target=self.timer_worker)
-        self.timer_thread.daemon = True
-        self.timer_thread.start()
-        
-        print("Smart Energy Saver started. Press 'q' to quit.")
-        print(f"No motion timeout: {self.no_motion_timeout} seconds")
-        
-        try:
+    def handle_key(self, key: int) -> bool:
+        """
+        Act on a key press from the display window
+        Returns: False if the user asked to quit
+        """
+        if key == ord('q'):
+            return False
+        elif key == ord('s'):
+            # Save current statistics
+            stats = self.logger.get_daily_stats()
+            print(f"Daily stats: {stats}")
+        elif key == ord('r'):
+            # Reset motion timer
+            self.last_motion_time = time.time()
+            print("Motion timer reset")
+        return True
+    
+    def make_loop(self):
+        """
+        Build the main frame loop as a closure
+        Components and settings that don't change while running are bound to
+        locals once, so the per-frame code avoids repeated attribute lookups.
+        """
+        read_frame = self.capture_thread.read
+        detect_motion = self.motion_detector.detect_motion
+        controller = self.energy_controller
+        turn_on = controller.turn_on_appliances
+        turn_off = controller.turn_off_appliances
+        log_event = self.logger.log_motion_event
+        draw_overlay = self.draw_info_overlay
+        handle_key = self.handle_key
+        timeout = self.no_motion_timeout
+        frame_skip = self._frame_skip
+        scale = self.detection_scale
+        upscale = 1 / scale
+        resize, imshow, wait_key, draw_contours = (
+            cv2.resize, cv2.imshow, cv2.waitKey, cv2.drawContours
+        )
+        inter_area = cv2.INTER_AREA
+        now = time.time
+        
+        def switch_off_if_idle(time_since_motion):
+            # Turn appliances off once the no-motion timeout has elapsed
+            if time_since_motion >= timeout:
+                if controller.lights_on or controller.fans_on:
+                    if turn_off():
+                        log_event(False, "OFF")
+        
+        def loop():
+            frame_count = 0
             while self.running:
-                ret, frame = self.cap.read()
+                ret, frame = read_frame()
                 if not ret:
                     print("Error: Could not read frame")
                     break
+                if frame is None:
+                    # No new frame within the read timeout; the timeout must
+                    # still fire if the camera stalls, and the window must
+                    # stay responsive
+                    switch_off_if_idle(now() - self.last_motion_time)
+                    if not handle_key(wait_key(1) & 0xFF):
+                        break
+                    continue
                 
-                # Detect motion
-                motion_detected, fg_mask, contours = self.motion_detector.detect_motion(frame)
+                # Skip detection and drawing on intermediate frames
+                frame_count += 1
+                if frame_count % frame_skip:
+                    if not handle_key(wait_key(1) & 0xFF):
+                        break
+                    continue
                 
-                current_time = time.time()
+                current_time = now()
                 time_since_motion = current_time - self.last_motion_time
                 
+                # Detect motion on a downscaled frame; the display stays full-res
+                small = resize(frame, (0, 0), fx=scale, fy=scale,
+                               interpolation=inter_area)
+                motion_detected, fg_mask, contours = detect_motion(small)
+                
                 # Handle motion detection
                 if motion_detected:
                     self.last_motion_time = current_time
-                    if self.energy_controller.turn_on_appliances():
-                        self.logger.log_motion_event(True, "ON")
+                    if turn_on():
+                        log_event(True, "ON")
                     
-                    # Draw contours on frame
-                    cv2.drawContours(frame, contours, -1, (0, 255, 0), 2)
+                    # Draw contours on frame, mapped back to full resolution
+                    contours = [(c * upscale).astype(np.int32) for c in contours]
+                    draw_contours(frame, contours, -1, (0, 255, 0), 2)
+                else:
+                    switch_off_if_idle(time_since_motion)
                 
                 # Draw information overlay
-                display_frame = self.draw_info_overlay(frame, motion_detected, time_since_motion)
+                display_frame = draw_overlay(frame, motion_detected, time_since_motion)
                 
                 # Show frames
-                cv2.imshow('Smart Energy Saver - Main Feed', display_frame)
-                cv2.imshow('Motion Detection', fg_mask)
+                imshow('Smart Energy Saver - Main Feed', display_frame)
+                imshow('Motion Detection', fg_mask)
                 
                 # Handle key presses
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
+                if not handle_key(wait_key(1) & 0xFF):
                     break
-                elif key == ord('s'):
-                    # Save current statistics
-                    stats = self.logger.get_daily_stats()
-                    print(f"Daily stats: {stats}")
-                elif key == ord('r'):
-                    # Reset motion timer
-                    self.last_motion_time = current_time
-                    print("Motion timer reset")
+        
+        return loop
+    
+    def run(self):
+        """Main execution loop"""
+        if not self.initialize_camera():
+            return
+        
+        self.running = True
+        
+        # Capture runs in its own thread so camera I/O overlaps with processing
+        self.capture_thread = CaptureThread(self.cap)
+        self.capture_thread.start()
+        
+        print("Smart Energy Saver started. Press 'q' to quit.")
+        print(f"No motion timeout: {self.no_motion_timeout} seconds")
+        
+        try:
+            self.make_loop()()
         
         except KeyboardInterrupt:
             print("\nShutdown requested by user")
@@ -352,18 +701,22 @@ class SmartEnergySaver:
         print("Cleaning up resources...")
         
         self.running = False
-        self.timer_running = False
         
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.join(timeout=2)
+        capture_stopped = True
+        if self.capture_thread:
+            capture_stopped = self.capture_thread.stop()
         
-        if self.cap:
+        # Releasing the camera while another thread is inside read() is
+        # undefined in OpenCV, so leave a stalled capture to process exit
+        if self.cap and capture_stopped:
             self.cap.release()
+        elif self.cap:
+            print("Warning: camera read still blocked; not releasing the camera")
         
         cv2.destroyAllWindows()
         
-        # Save events and statistics
-        self.logger.save_events_to_file()
+        # Flush the event journal and report statistics
+        self.logger.close()
         stats = self.logger.get_daily_stats()
         print(f"Final daily statistics: {stats}")
         
@@ -382,13 +735,16 @@ def main():
                        help='Motion detection sensitivity (default: 25)')
     parser.add_argument('--min-area', type=int, default=1000, 
                        help='Minimum area for motion detection (default: 1000)')
+    parser.add_argument('--frame-skip', type=int, default=3, 
+                       help='Process one of every N frames (default: 3)')
     
     args = parser.parse_args()
     
     # Create and run the energy saver system
     energy_saver = SmartEnergySaver(
         camera_index=args.camera,
-        no_motion_timeout=args.timeout
+        no_motion_timeout=args.timeout,
+        frame_skip=args.frame_skip
     )
     
     # Configure motion detector with custom parameters
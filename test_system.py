@@ -55,11 +55,14 @@ def test_classes():
         print("✅ MotionDetector instantiated successfully")
         
         # Test EventLogger
-        logger = EventLogger()
+        logger = EventLogger("test_energy_saver.log", "test_motion_events.jsonl")
+        logger.close()
         print("✅ EventLogger instantiated successfully")
         
         # Test SmartEnergySaver
-        saver = SmartEnergySaver()
+        saver = SmartEnergySaver(log_file="test_energy_saver.log",
+                                 events_file="test_motion_events.jsonl")
+        saver.logger.close()
         print("✅ SmartEnergySaver instantiated successfully")
         
         return True
@@ -128,14 +131,83 @@ def test_motion_detector():
         print(f"❌ MotionDetector test failed: {e}")
         return False
 
+def test_timeout_extended_by_motion():
+    """Test that sporadic motion early in the timeout window delays switch-off"""
+    print("\n🧪 Testing no-motion timeout with sporadic motion...")
+    
+    import cv2
+    import types
+    import numpy as np
+    import smart_energy_saver
+    
+    # Fake clock advanced by the fake camera, 10 frames per simulated second
+    clock = types.SimpleNamespace(t=0.0)
+    fake_time = types.SimpleNamespace(time=lambda: clock.t)
+    real_time, real_imshow, real_wait_key = smart_energy_saver.time, cv2.imshow, cv2.waitKey
+    
+    try:
+        saver = smart_energy_saver.SmartEnergySaver(
+            no_motion_timeout=60, frame_skip=1,
+            log_file="test_energy_saver.log", events_file="test_motion_events.jsonl"
+        )
+        saver.last_motion_time = 0.0
+        saver.running = True
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        mask = np.zeros((240, 320), dtype=np.uint8)
+        switch_off = []
+        
+        def read(timeout=1.0):
+            clock.t += 0.1
+            if not saver.energy_controller.lights_on and not switch_off:
+                switch_off.append(clock.t)
+            if clock.t >= 130:
+                saver.running = False
+            return True, frame
+        
+        def detect_motion(small):
+            # Someone moves briefly at 10 s, 30 s and 50 s, then the room is still
+            moving = any(start <= clock.t < start + 1 for start in (10, 30, 50))
+            return moving, mask, []
+        
+        saver.capture_thread = types.SimpleNamespace(read=read)
+        saver.motion_detector.detect_motion = detect_motion
+        smart_energy_saver.time = fake_time
+        cv2.imshow = lambda *args: None
+        cv2.waitKey = lambda delay: -1
+        
+        saver.make_loop()()
+        saver.logger.close()
+        
+        # Last motion ends at ~51 s, so nothing may switch off before ~111 s
+        assert switch_off, "Appliances were never switched off"
+        assert switch_off[0] >= 110, f"Switched off too early at {switch_off[0]:.1f}s"
+        print(f"✅ Appliances switched off at {switch_off[0]:.1f}s, 60s after the last motion")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Timeout test failed: {e}")
+        return False
+    
+    finally:
+        smart_energy_saver.time = real_time
+        cv2.imshow, cv2.waitKey = real_imshow, real_wait_key
+
 def test_event_logger():
     """Test EventLogger functionality"""
     print("\n🧪 Testing EventLogger...")
     
     try:
+        import os
+        import orjson
         from smart_energy_saver import EventLogger
         
-        logger = EventLogger("test_energy_saver.log")
+        # Start from an empty journal; earlier tests or aborted runs may have
+        # left one behind
+        if os.path.exists("test_motion_events.jsonl"):
+            os.remove("test_motion_events.jsonl")
+        
+        logger = EventLogger("test_energy_saver.log", "test_motion_events.jsonl")
         
         # Test logging an event
         logger.log_motion_event(True, "ON")
@@ -144,12 +216,24 @@ def test_event_logger():
         
         # Test statistics
         stats = logger.get_daily_stats()
+        assert stats['total_events'] == 2
+        assert stats['motion_detections'] == 1
+        assert stats['energy_saves'] == 1
         print(f"✅ Statistics generation works: {stats}")
         
         # Test saving events
         logger.save_events_to_file("test_motion_events.json")
+        with open("test_motion_events.json", "rb") as f:
+            assert len(orjson.loads(f.read())) == 2
         print("✅ Event saving works")
         
+        # Test the background journal writer
+        logger.close()
+        with open("test_motion_events.jsonl") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2
+        print("✅ Event journaling works")
+        
         return True
         
     except Exception as e:
@@ -161,10 +245,10 @@ def test_configuration():
     print("\n🧪 Testing configuration...")
     
     try:
-        import json
+        import orjson
         
-        with open('config.json', 'r') as f:
-            config = json.load(f)
+        with open('config.json', 'rb') as f:
+            config = orjson.loads(f.read())
         
         # Check required sections
         required_sections = ['camera', 'motion_detection', 'energy_control', 'mqtt', 'logging']
@@ -187,7 +271,8 @@ def cleanup_test_files():
     
     test_files = [
         'test_energy_saver.log',
-        'test_motion_events.json'
+        'test_motion_events.json',
+        'test_motion_events.jsonl'
     ]
     
     for file in test_files:
@@ -209,6 +294,7 @@ def main():
         ("Classes", test_classes),
         ("EnergyController", test_energy_controller),
         ("MotionDetector", test_motion_detector),
+        ("Timeout", test_timeout_extended_by_motion),
         ("EventLogger", test_event_logger),
         ("Configuration", test_configuration),
     ]